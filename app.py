@@ -1,15 +1,22 @@
 import feedparser
 import pandas as pd
 import json
-import hashlib
 import re
+import html
+import threading
 import time
+import calendar
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Tuple
+from urllib.parse import urlparse
+from typing import List, Dict, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from email.utils import parsedate_to_datetime
 import pytz
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
 
 # =============================================================================
@@ -37,6 +44,10 @@ APP_SETTINGS = CONFIG.get('app', {})
 NFL_TEAMS = CONFIG.get('teams', [])
 RSS_FEED_SOURCES = CONFIG.get('rss_feeds', {})
 
+# Static filter options, built once instead of on every rerun
+ALL_TEAMS_OPTION = 'All Teams'
+SORT_OPTIONS = ['Newest First', 'Oldest First']
+
 # =============================================================================
 # PAGE CONFIGURATION
 # =============================================================================
@@ -56,249 +67,453 @@ if 'theme_mode' not in st.session_state:
 # RSS FEED FETCHER
 # =============================================================================
 
+class FeedValidatorCache:
+    """Thread-safe store of ETag/Last-Modified validators and parsed articles per feed URL"""
+    
+    def __init__(self):
+        self._feeds: Dict[str, Tuple[Optional[str], Optional[str], pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], pd.DataFrame]]:
+        with self._lock:
+            return self._feeds.get(url)
+    
+    def put(self, url: str, etag: Optional[str], modified: Optional[str], articles: pd.DataFrame):
+        with self._lock:
+            self._feeds[url] = (etag, modified, articles)
+
 class RSSFeedFetcher:
     """Handles RSS feed fetching with robust error handling and parallel processing"""
     
-    def __init__(self, days_lookback: int = 7, max_entries: int = 100):
+    # Compiled once at class level instead of going through re's cache on every summary
+    HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+    
+    def __init__(self, days_lookback: int = 7, max_entries: int = 100, max_workers: int = 10,
+                 session: Optional[requests.Session] = None,
+                 feed_cache: Optional[FeedValidatorCache] = None):
         self.days_lookback = days_lookback
         self.max_entries = max_entries
+        self.max_workers = max_workers
         self.cutoff_date = datetime.now() - timedelta(days=days_lookback)
+        self.cutoff_timestamp = pd.Timestamp(self.cutoff_date)
         self.successful_fetches = 0
         self.failed_fetches = 0
+        self.session = session or self.create_http_session(pool_maxsize=max_workers)
+        self.feed_cache = feed_cache
     
-    def sanitize_html_content(self, text: str) -> str:
-        """Remove HTML tags and clean text content"""
+    @staticmethod
+    def create_http_session(pool_maxsize: int = 10) -> requests.Session:
+        """Create a pooled HTTP session so repeat hosts reuse TCP/TLS connections"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        # Feeds span dozens of hosts, so keep a pool per host rather than evicting them;
+        # each host pool holds as many connections as there are worker threads
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Retry-After can ask for hours; keep the short backoff so one feed
+                # cannot stall the shared refresh
+                respect_retry_after_header=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def html_to_text(self, text: str) -> str:
+        """Strip HTML tags and entities, leaving plain text with collapsed whitespace"""
         if not text:
             return ""
-        text = re.sub(r'<[^>]+>', '', text)
-        text = ' '.join(text.split())
+        text = html.unescape(self.HTML_TAG_PATTERN.sub('', text))
+        return ' '.join(text.split())
+    
+    def sanitize_html_content(self, text: str) -> str:
+        """Remove HTML tags and clean text content"""
+        text = self.html_to_text(text)
         if len(text) > 300:
             text = text[:300] + '...'
         return text
     
-    def fetch_feed(self, url: str, source_name: str = "") -> List[Dict]:
-        """Fetch a single RSS feed with comprehensive error handling"""
+    @staticmethod
+    def parse_entry_timestamp(entry) -> Optional[float]:
+        """Return the entry's publish time as UTC epoch seconds, or None if unknown"""
+        # Try published_parsed first, then updated_parsed (both are UTC struct_time)
+        pub_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        
+        if pub_parsed:
+            try:
+                return calendar.timegm(pub_parsed)
+            except (ValueError, OverflowError, TypeError):
+                pass
+        
+        # If parsing failed or no date found, try string parsing
+        for date_field in ['published', 'updated']:
+            date_str = entry.get(date_field, '')
+            if date_str:
+                try:
+                    pub_date = parsedate_to_datetime(date_str)
+                    # If timezone-naive, assume UTC
+                    if pub_date.tzinfo is None:
+                        pub_date = pytz.UTC.localize(pub_date)
+                    return pub_date.timestamp()
+                except (TypeError, ValueError):
+                    pass
+        
+        return None
+    
+    def fetch_feed(self, url: str, source_name: str = "", team: Optional[str] = None) -> pd.DataFrame:
+        """Fetch a single RSS feed into a column-built DataFrame with comprehensive error handling"""
         try:
-            feed = feedparser.parse(url, request_headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            # Send the validators from the last fetch so unchanged feeds answer 304 with no body
+            cached = self.feed_cache.get(url) if self.feed_cache is not None else None
+            request_headers = {}
+            if cached:
+                etag, modified, _ = cached
+                if etag:
+                    request_headers['If-None-Match'] = etag
+                if modified:
+                    request_headers['If-Modified-Since'] = modified
+            
+            response = self.session.get(url, headers=request_headers, timeout=10)
+            
+            if response.status_code == 304 and cached:
+                cached_articles = cached[2]
+                self.successful_fetches += 1
+                return cached_articles[cached_articles['published'] >= self.cutoff_timestamp]
+            
+            response.raise_for_status()
+            
+            # Hand the downloaded bytes to feedparser so it only parses. Summaries are
+            # stripped to plain text, so rewriting relative URIs inside them is wasted work;
+            # sanitizing stays on because titles end up in unsafe_allow_html markup.
+            feed = feedparser.parse(
+                response.content,
+                # content-location gives feedparser the final, post-redirect feed URL as
+                # the base for relative item links
+                response_headers={
+                    'content-type': response.headers.get('Content-Type', ''),
+                    'content-location': response.url
+                },
+                resolve_relative_uris=False
+            )
             
             if not feed.entries:
                 self.failed_fetches += 1
-                return []
-            
-            # Define EST timezone
-            est = pytz.timezone('US/Eastern')
-            utc = pytz.UTC
+                return pd.DataFrame()
             
-            articles = []
+            entries = []
+            pub_timestamps = []
             for entry in feed.entries[:self.max_entries]:
-                title = entry.get('title', '').strip()
+                # feedparser keeps markup and entities in text/html titles; the renderer
+                # escapes once, so the frame must hold plain text
+                title = self.html_to_text(entry.get('title', ''))
                 link = entry.get('link', '')
                 
                 if not title or not link:
                     continue
                 
-                # IMPROVED DATE PARSING WITH EST CONVERSION
-                pub_date = None
-                
-                # Try published_parsed first, then updated_parsed
-                pub_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
-                
-                if pub_parsed:
-                    try:
-                        # Convert struct_time to UTC datetime
-                        pub_date = datetime.fromtimestamp(time.mktime(pub_parsed), tz=utc)
-                    except (ValueError, OverflowError, OSError):
-                        pass
-                
-                # If parsing failed or no date found, try string parsing
-                if pub_date is None:
-                    for date_field in ['published', 'updated']:
-                        date_str = entry.get(date_field, '')
-                        if date_str:
-                            try:
-                                pub_date = parsedate_to_datetime(date_str)
-                                # If timezone-naive, assume UTC
-                                if pub_date.tzinfo is None:
-                                    pub_date = utc.localize(pub_date)
-                                break
-                            except:
-                                pass
-                
-                # Fall back to current time in UTC if all parsing failed
-                if pub_date is None:
-                    pub_date = datetime.now(utc)
-                
-                # Convert to EST
-                pub_date_est = pub_date.astimezone(est)
-                
-                # Make timezone-naive for storage and comparison
-                pub_date_naive = pub_date_est.replace(tzinfo=None)
+                # Links land in an href, so only web URLs get through (no javascript:/data:)
+                if urlparse(link).scheme not in ('http', 'https'):
+                    continue
                 
-                if pub_date_naive >= self.cutoff_date:
-                    summary = entry.get('summary', entry.get('description', ''))
-                    summary = self.sanitize_html_content(summary)
-                    
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'published': pub_date_naive,
-                        'source': source_name,
-                        'summary': summary
-                    })
+                entries.append((title, link, entry))
+                pub_timestamps.append(self.parse_entry_timestamp(entry))
+            
+            if not entries:
+                self.successful_fetches += 1
+                return pd.DataFrame()
+            
+            # Convert every publish time to naive EST in one vectorized pass,
+            # falling back to the current time when an entry had no usable date
+            pub_dates = (
+                pd.to_datetime(pub_timestamps, unit='s', utc=True)
+                .fillna(pd.Timestamp.now(tz='UTC'))
+                .tz_convert('US/Eastern')
+                .tz_localize(None)
+            )
+            is_recent = pub_dates >= self.cutoff_timestamp
+            
+            recent_entries = [entry for entry, recent in zip(entries, is_recent) if recent]
+            
+            # Build the frame column by column rather than from one dict per article
+            articles = pd.DataFrame({
+                'title': [title for title, _, _ in recent_entries],
+                'link': [link for _, link, _ in recent_entries],
+                'published': pub_dates[is_recent],
+                'source': source_name,
+                'team': team,
+                # feedparser already maps <description> onto 'summary'
+                'summary': [self.sanitize_html_content(entry.get('summary', '')) for _, _, entry in recent_entries]
+            })
+            
+            if self.feed_cache is not None:
+                self.feed_cache.put(
+                    url,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    articles
+                )
             
             self.successful_fetches += 1
             return articles
             
         except Exception as e:
             self.failed_fetches += 1
-            return []
+            return pd.DataFrame()
     
-    def fetch_multiple_feeds(self, feeds: List[Tuple[str, str]], max_workers: int = 10) -> List[Dict]:
-        """Fetch multiple RSS feeds in parallel for improved performance"""
-        articles = []
+    def fetch_multiple_feeds(self, feeds: List[Tuple[str, str, Optional[str]]], max_workers: Optional[int] = None) -> pd.DataFrame:
+        """Fetch multiple (url, source name, team) feeds in parallel for improved performance"""
+        frames = []
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(self.fetch_feed, url, name): (url, name)
-                      for url, name in feeds}
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = {executor.submit(self.fetch_feed, url, name, team): (url, name)
+                      for url, name, team in feeds}
             
             for future in as_completed(futures):
                 try:
-                    articles.extend(future.result())
-                except:
+                    articles = future.result()
+                    if not articles.empty:
+                        frames.append(articles)
+                except Exception:
                     pass
         
-        return articles
+        if not frames:
+            return pd.DataFrame()
+        
+        # One concat of per-feed frames instead of inferring a schema from every row
+        return pd.concat(frames, ignore_index=True)
+
+@st.cache_resource
+def get_shared_http_session(pool_maxsize: int = 10) -> requests.Session:
+    """Pooled session shared across fetches so warm connections survive between refreshes"""
+    return RSSFeedFetcher.create_http_session(pool_maxsize=pool_maxsize)
+
+@st.cache_resource
+def get_feed_validator_cache() -> FeedValidatorCache:
+    """Per-feed validators that persist across refreshes for conditional GETs"""
+    return FeedValidatorCache()
 
 # =============================================================================
 # DATA PROCESSING UTILITIES
 # =============================================================================
 
+TEAM_KEYWORD_MAPPING = {
+    'CARDINALS': 'Arizona Cardinals',
+    'FALCONS': 'Atlanta Falcons',
+    'RAVENS': 'Baltimore Ravens',
+    'BILLS': 'Buffalo Bills',
+    'PANTHERS': 'Carolina Panthers',
+    'BEARS': 'Chicago Bears',
+    'BENGALS': 'Cincinnati Bengals',
+    'BROWNS': 'Cleveland Browns',
+    'COWBOYS': 'Dallas Cowboys',
+    'BRONCOS': 'Denver Broncos',
+    'LIONS': 'Detroit Lions',
+    'PACKERS': 'Green Bay Packers',
+    'TEXANS': 'Houston Texans',
+    'COLTS': 'Indianapolis Colts',
+    'JAGUARS': 'Jacksonville Jaguars',
+    'CHIEFS': 'Kansas City Chiefs',
+    'RAIDERS': 'Las Vegas Raiders',
+    'CHARGERS': 'Los Angeles Chargers',
+    'RAMS': 'Los Angeles Rams',
+    'DOLPHINS': 'Miami Dolphins',
+    'VIKINGS': 'Minnesota Vikings',
+    'PATRIOTS': 'New England Patriots',
+    'SAINTS': 'New Orleans Saints',
+    'GIANTS': 'New York Giants',
+    'JETS': 'New York Jets',
+    'EAGLES': 'Philadelphia Eagles',
+    'STEELERS': 'Pittsburgh Steelers',
+    '49ERS': 'San Francisco 49ers',
+    'SEAHAWKS': 'Seattle Seahawks',
+    'BUCCANEERS': 'Tampa Bay Buccaneers',
+    'BUCS': 'Tampa Bay Buccaneers',
+    'TITANS': 'Tennessee Titans',
+    'COMMANDERS': 'Washington Commanders'
+}
+
+@lru_cache(maxsize=8)
+def compile_team_matcher(teams: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """Compile team keywords and full team names into a single alternation"""
+    lookup = {team.upper(): team for team in teams}
+    lookup.update(TEAM_KEYWORD_MAPPING)
+    
+    # Longest names first so full team names win over their nickname keyword; word
+    # boundaries keep nicknames from matching inside other words (e.g. RAMS in PROGRAMS)
+    alternatives = sorted(lookup, key=len, reverse=True)
+    pattern = re.compile(r'\b(' + '|'.join(re.escape(name) for name in alternatives) + r')\b')
+    
+    return pattern, lookup
+
 class NewsDataProcessor:
     """Utilities for processing and cleaning news data"""
     
-    @staticmethod
-    def generate_content_hash(text: str) -> str:
-        """Generate MD5 hash for content deduplication"""
-        return hashlib.md5(text.encode()).hexdigest()
-    
     @staticmethod
     def remove_duplicate_articles(df: pd.DataFrame) -> pd.DataFrame:
         """Remove duplicate articles based on headline content"""
         if df.empty:
             return df
         
-        df['content_hash'] = df['headline'].apply(NewsDataProcessor.generate_content_hash)
-        df = df.drop_duplicates(subset=['content_hash']).drop(columns=['content_hash'])
-        
-        return df
+        # Compare case- and whitespace-normalized headlines; pandas hashes the column in C
+        normalized = df['headline'].str.lower().str.strip()
+        return df[~normalized.duplicated(keep='first')]
     
     @staticmethod
     def identify_team_from_content(text: str, teams: List[str]) -> str:
         """Extract NFL team name from article content using keyword matching"""
-        text_upper = text.upper()
-        
-        team_keyword_mapping = {
-            'CARDINALS': 'Arizona Cardinals',
-            'FALCONS': 'Atlanta Falcons',
-            'RAVENS': 'Baltimore Ravens',
-            'BILLS': 'Buffalo Bills',
-            'PANTHERS': 'Carolina Panthers',
-            'BEARS': 'Chicago Bears',
-            'BENGALS': 'Cincinnati Bengals',
-            'BROWNS': 'Cleveland Browns',
-            'COWBOYS': 'Dallas Cowboys',
-            'BRONCOS': 'Denver Broncos',
-            'LIONS': 'Detroit Lions',
-            'PACKERS': 'Green Bay Packers',
-            'TEXANS': 'Houston Texans',
-            'COLTS': 'Indianapolis Colts',
-            'JAGUARS': 'Jacksonville Jaguars',
-            'CHIEFS': 'Kansas City Chiefs',
-            'RAIDERS': 'Las Vegas Raiders',
-            'CHARGERS': 'Los Angeles Chargers',
-            'RAMS': 'Los Angeles Rams',
-            'DOLPHINS': 'Miami Dolphins',
-            'VIKINGS': 'Minnesota Vikings',
-            'PATRIOTS': 'New England Patriots',
-            'SAINTS': 'New Orleans Saints',
-            'GIANTS': 'New York Giants',
-            'JETS': 'New York Jets',
-            'EAGLES': 'Philadelphia Eagles',
-            'STEELERS': 'Pittsburgh Steelers',
-            '49ERS': 'San Francisco 49ers',
-            'SEAHAWKS': 'Seattle Seahawks',
-            'BUCCANEERS': 'Tampa Bay Buccaneers',
-            'BUCS': 'Tampa Bay Buccaneers',
-            'TITANS': 'Tennessee Titans',
-            'COMMANDERS': 'Washington Commanders'
-        }
-        
-        for keyword, team in team_keyword_mapping.items():
-            if keyword in text_upper:
-                return team
+        pattern, lookup = compile_team_matcher(tuple(teams))
         
-        for team in teams:
-            if team.upper() in text_upper:
-                return team
+        # One regex pass over the headline instead of a substring scan per keyword
+        match = pattern.search(text.upper())
+        if match:
+            return lookup[match.group(0)]
         
         return 'NFL General'
+    
+    @staticmethod
+    def identify_teams_from_headlines(headlines: pd.Series, teams: List[str]) -> pd.Series:
+        """Vectorized identify_team_from_content over a whole column of headlines"""
+        pattern, lookup = compile_team_matcher(tuple(teams))
+        
+        matches = headlines.str.upper().str.extract(pattern, expand=False)
+        return matches.map(lookup).fillna('NFL General')
+
+# =============================================================================
+# DISK CACHE
+# =============================================================================
+
+CACHE_DIR = Path(__file__).parent / '.cache'
+
+def prune_disk_cache(max_age_hours: int = 24):
+    """Delete cached snapshots older than the given age"""
+    if not CACHE_DIR.exists():
+        return
+    
+    cutoff = time.time() - max_age_hours * 3600
+    for cache_file in CACHE_DIR.glob('*.parquet'):
+        try:
+            if cache_file.stat().st_mtime < cutoff:
+                cache_file.unlink()
+        except OSError:
+            pass
+
+def load_cached_dataframe(cache_name: str, ttl: int) -> Optional[pd.DataFrame]:
+    """Load a parquet snapshot from disk if it is younger than ttl seconds"""
+    cache_path = CACHE_DIR / f'{cache_name}.parquet'
+    
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl:
+            return pd.read_parquet(cache_path)
+    except Exception:
+        pass
+    
+    return None
+
+def load_latest_cached_dataframe(cache_prefix: str) -> Optional[pd.DataFrame]:
+    """Load the newest snapshot regardless of age, as a fallback when a fetch fails"""
+    snapshots = sorted(
+        CACHE_DIR.glob(f'{cache_prefix}_*.parquet'),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True
+    )
+    
+    for snapshot in snapshots:
+        try:
+            return pd.read_parquet(snapshot)
+        except Exception:
+            continue
+    
+    return None
+
+def save_cached_dataframe(df: pd.DataFrame, cache_name: str):
+    """Persist a DataFrame snapshot so process restarts can skip refetching"""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        df.to_parquet(CACHE_DIR / f'{cache_name}.parquet', compression='zstd')
+    except Exception:
+        pass
 
 # =============================================================================
 # DATA FETCHING AND CACHING
 # =============================================================================
 
-@st.cache_data(ttl=APP_SETTINGS.get('cache_ttl', 1800), show_spinner=False)
+# Cached as a shared resource so cache hits skip pickling a copy of the frame;
+# callers must treat the returned DataFrame as read-only
+@st.cache_resource(ttl=APP_SETTINGS.get('cache_ttl', 1800), show_spinner=False)
 def fetch_all_news_articles() -> pd.DataFrame:
     """Fetch and process all news articles from configured RSS feeds"""
-    fetcher = RSSFeedFetcher(days_lookback=APP_SETTINGS.get('days_lookback', 7))
-    news_items = []
-    
-    # Fetch from general NFL news sources
+    cache_ttl = APP_SETTINGS.get('cache_ttl', 1800)
+    cache_name = f"news_{datetime.now().strftime('%Y%m%d%H')}"
+    
+    prune_disk_cache()
+    cached_df = load_cached_dataframe(cache_name, cache_ttl)
+    if cached_df is not None:
+        return cached_df
+    
+    max_workers = APP_SETTINGS.get('max_workers', 10)
+    fetcher = RSSFeedFetcher(
+        days_lookback=APP_SETTINGS.get('days_lookback', 7),
+        max_workers=max_workers,
+        session=get_shared_http_session(max_workers),
+        feed_cache=get_feed_validator_cache()
+    )
+    
+    # General NFL news sources carry no team; team feeds are labelled with their team
     general_feeds = [
-        (feed['url'], feed['name'])
+        (feed['url'], feed['name'], None)
         for feed in RSS_FEED_SOURCES.get('general_news', [])
         if feed.get('enabled', True)
     ]
+    team_feeds = [
+        (url, team, team)
+        for team, feeds in RSS_FEED_SOURCES.get('team_feeds', {}).items()
+        if isinstance(feeds, list)
+        for url in feeds
+        if url
+    ]
     
-    if general_feeds:
-        articles = fetcher.fetch_multiple_feeds(general_feeds, max_workers=APP_SETTINGS.get('max_workers', 10))
-        
-        for article in articles:
-            team = NewsDataProcessor.identify_team_from_content(article['title'], NFL_TEAMS)
-            news_items.append({
-                'team': team,
-                'headline': article['title'],
-                'link': article['link'],
-                'date': article['published'],
-                'source': article['source'],
-                'summary': article['summary']
-            })
+    # Fan out over every feed in one pool so general and team hosts all overlap
+    df = fetcher.fetch_multiple_feeds(general_feeds + team_feeds)
     
-    # Fetch from team-specific feeds
-    team_feeds_dict = RSS_FEED_SOURCES.get('team_feeds', {})
-    for team, feeds in team_feeds_dict.items():
-        if isinstance(feeds, list):
-            team_feed_list = [(url, team) for url in feeds if url]
-            articles = fetcher.fetch_multiple_feeds(team_feed_list, max_workers=APP_SETTINGS.get('max_workers', 10))
-            
-            for article in articles:
-                news_items.append({
-                    'team': team,
-                    'headline': article['title'],
-                    'link': article['link'],
-                    'date': article['published'],
-                    'source': article['source'],
-                    'summary': article['summary']
-                })
-    
-    if not news_items:
-        return pd.DataFrame()
-    
-    df = pd.DataFrame(news_items)
+    if df.empty:
+        # Serve the last good snapshot instead of an empty page when every feed failed
+        stale_df = load_latest_cached_dataframe('news')
+        return stale_df if stale_df is not None else pd.DataFrame()
+    
+    df = df.rename(columns={'title': 'headline', 'published': 'date'})
+    df = df[['team', 'headline', 'link', 'date', 'source', 'summary']]
+    
+    # Sort once up front; deduplication keeps the first (most recent) copy and preserves the order
+    df = df.sort_values('date', ascending=False, ignore_index=True)
     df = NewsDataProcessor.remove_duplicate_articles(df)
-    df = df.sort_values('date', ascending=False)
+    
+    # Detect teams for the remaining general-feed headlines in one batch, after dedup
+    # so repeated headlines are only matched once
+    untagged = df['team'].isna()
+    if untagged.any():
+        df.loc[untagged, 'team'] = NewsDataProcessor.identify_teams_from_headlines(
+            df.loc[untagged, 'headline'], NFL_TEAMS
+        )
+    
+    # Low-cardinality labels become int codes, so filters are integer compares and
+    # each distinct string is stored once; categories come out sorted, which also gives
+    # main() its team list without a unique/sort pass on every rerun
+    for column in ('team', 'source'):
+        df[column] = df[column].astype('category')
+    
+    # Free-text columns live in contiguous Arrow buffers so string ops run in C
+    df = df.astype({column: 'string[pyarrow]' for column in ('headline', 'link', 'summary')})
+    
+    save_cached_dataframe(df, cache_name)
     
     return df
 
@@ -306,10 +521,10 @@ def fetch_all_news_articles() -> pd.DataFrame:
 # THEME MANAGEMENT
 # =============================================================================
 
-def get_theme_styles() -> str:
-    """Generate CSS styles based on current theme mode"""
+def get_theme_styles(theme_mode: str) -> str:
+    """Generate CSS styles for the given theme mode"""
     
-    if st.session_state.theme_mode == 'dark':
+    if theme_mode == 'dark':
         return """
         :root {
             --bg-primary: #0f172a;
@@ -342,11 +557,12 @@ def get_theme_styles() -> str:
         }
         """
 
-def apply_application_styles():
-    """Apply comprehensive CSS styling to the application"""
-    theme_vars = get_theme_styles()
+@st.cache_resource(show_spinner=False)
+def build_application_styles(theme_mode: str) -> str:
+    """Build the full stylesheet once per theme mode instead of on every rerun"""
+    theme_vars = get_theme_styles(theme_mode)
     
-    st.markdown(f"""
+    return f"""
     <style>
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
         
@@ -605,7 +821,11 @@ def apply_application_styles():
         header {{visibility: hidden;}}
         .stDeployButton {{display: none;}}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def apply_application_styles():
+    """Apply comprehensive CSS styling to the application"""
+    st.markdown(build_application_styles(st.session_state.theme_mode), unsafe_allow_html=True)
 
 # =============================================================================
 # UI COMPONENTS
@@ -654,25 +874,29 @@ def render_metrics_dashboard(df: pd.DataFrame):
     </div>
     """, unsafe_allow_html=True)
 
-def render_news_article(row: pd.Series):
-    """Render individual news article card"""
-    date_str = row['date'].strftime('%b %d, %Y %I:%M %p EST')
-    
-    summary_html = f"<div class='article-summary'>{row['summary']}</div>" if row['summary'] else ""
-    
-    st.markdown(f"""
-    <div class="news-article">
-        <div class="article-header">
-            <span class="article-timestamp">{date_str}</span>
-            <span class="article-team-badge">{row['team']}</span>
-            <span class="article-source">{row['source']}</span>
-        </div>
-        <a href="{row['link']}" target="_blank" class="article-headline">
-            {row['headline']}
-        </a>
-        {summary_html}
-    </div>
-    """, unsafe_allow_html=True)
+def render_news_articles(df: pd.DataFrame):
+    """Render all news article cards with a single markdown call"""
+    date_str = df['date'].dt.strftime('%b %d, %Y %I:%M %p EST')
+    
+    # Feed text goes into raw HTML, so escape each column once; categoricals only escape their categories
+    headline = df['headline'].map(html.escape)
+    link = df['link'].map(html.escape)
+    team = df['team'].map(html.escape).astype(str)
+    source = df['source'].map(html.escape).astype(str)
+    summary = df['summary'].fillna('').map(html.escape)
+    summary_html = ("<div class='article-summary'>" + summary + "</div>").where(summary != '', '')
+    
+    # Build every card in one vectorized pass; one card per line keeps each inside the HTML block
+    cards = (
+        '<div class="news-article"><div class="article-header">'
+        + '<span class="article-timestamp">' + date_str + '</span>'
+        + '<span class="article-team-badge">' + team + '</span>'
+        + '<span class="article-source">' + source + '</span>'
+        + '</div><a href="' + link + '" target="_blank" class="article-headline">'
+        + headline + '</a>' + summary_html + '</div>'
+    )
+    
+    st.markdown('\n'.join(cards.tolist()), unsafe_allow_html=True)
 
 # =============================================================================
 # MAIN APPLICATION
@@ -697,13 +921,13 @@ def main():
     # Filters
     st.markdown('<div class="section-title">📰 News Feed</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns([2, 2])
+    col1, col2, col3 = st.columns([2, 2, 1])
     
     with col1:
         st.markdown('<div class="filter-label">Filter by Team</div>', unsafe_allow_html=True)
         selected_team = st.selectbox(
             'Team',
-            ['All Teams'] + sorted(df['team'].unique().tolist()),
+            [ALL_TEAMS_OPTION] + df['team'].cat.categories.tolist(),
             label_visibility="collapsed",
             key='team_filter'
         )
@@ -712,30 +936,50 @@ def main():
         st.markdown('<div class="filter-label">Sort By</div>', unsafe_allow_html=True)
         sort_order = st.selectbox(
             'Sort',
-            ['Newest First', 'Oldest First'],
+            SORT_OPTIONS,
             label_visibility="collapsed",
             key='sort_filter'
         )
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters; the rendering below only reads the frame, so no defensive copy
+    filtered_df = df
     
-    if selected_team != 'All Teams':
+    if selected_team != ALL_TEAMS_OPTION:
         filtered_df = filtered_df[filtered_df['team'] == selected_team]
     
-    # Apply sorting
-    if sort_order == 'Oldest First':
-        filtered_df = filtered_df.sort_values('date', ascending=True)
+    # Apply sorting; the data is already newest first, so oldest first is a reversed view
+    if sort_order == SORT_OPTIONS[1]:
+        filtered_df = filtered_df.iloc[::-1]
+    
+    # Only the current page is rendered, so each rerun ships a bounded amount of HTML
+    page_size = APP_SETTINGS.get('page_size', 50)
+    total_articles = len(filtered_df)
+    total_pages = max(1, -(-total_articles // page_size))
+    
+    with col3:
+        st.markdown('<div class="filter-label">Page</div>', unsafe_allow_html=True)
+        page = st.number_input(
+            'Page',
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            label_visibility="collapsed",
+            key='page_number'
+        )
+    
+    page = min(int(page), total_pages)
+    start = (page - 1) * page_size
+    page_df = filtered_df.iloc[start:start + page_size]
     
     # Display article count
-    st.markdown(f"<div style='margin: 1.5rem 0 1rem 0; color: var(--text-secondary); font-size: 0.875rem;'>Showing <strong>{len(filtered_df)}</strong> articles</div>", unsafe_allow_html=True)
+    st.markdown(f"<div style='margin: 1.5rem 0 1rem 0; color: var(--text-secondary); font-size: 0.875rem;'>Showing <strong>{len(page_df)}</strong> of <strong>{total_articles}</strong> articles (page {page} of {total_pages})</div>", unsafe_allow_html=True)
     
     # Render articles
-    if filtered_df.empty:
+    if page_df.empty:
         st.info("No articles match your filter criteria.")
     else:
-        for _, row in filtered_df.iterrows():
-            render_news_article(row)
+        render_news_articles(page_df)
 
 if __name__ == "__main__":
     main()